@@ -116,6 +116,9 @@ napoleon_custom_sections = [
 # -- Options for autoapi -----------------------------------------------------
 # https://sphinx-autoapi.readthedocs.io/en/latest/reference/config.html
 
+# Keeping files lets AutoAPI skip its parse stage when no source file has a
+# newer mtime than the previous build. Use 'make html-force' to start clean.
+
 autoapi_root = 'api'
 autoapi_type = 'python'
 autoapi_keep_files = True
@@ -123,6 +126,11 @@ autodoc_typehints = 'none'
 autoapi_member_order = 'groupwise'
 autoapi_python_class_content = 'both'
 autoapi_dirs = ['../../src/ampworks']
+autoapi_ignore = [  # dash layouts/callbacks are internal to the GUI
+    '*migrations*',
+    '*/__pycache__/*',
+    '*/gui_files/*',
+]
 autoapi_options = [
     'members',
     'imported-members',
@@ -161,7 +161,7 @@ def run_sphinx(session: nox.Session) -> None:
 
     run_spellcheck(session)
 
-    session.run('sphinx-build', 'docs/source', 'docs/build')
+    session.run('sphinx-build', '-j', 'auto', 'docs/source', 'docs/build')
 
 
 @nox.session(name='pre-commit', python=False)
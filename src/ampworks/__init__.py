@@ -22,19 +22,13 @@ includes search functionality and more detailed examples.
 
 from typing import TYPE_CHECKING
 
-from ._core import (
-    Dataset,
-    read_csv,
-    read_excel,
-    read_table,
-)
-
 __version__ = '0.0.2.dev0'
 
 __all__ = [
     'Dataset',
     'read_csv',
     'read_excel',
+    'read_many',
     'read_table',
     'ocv',
     'ici',
@@ -53,6 +47,9 @@ if TYPE_CHECKING:  # pragma: no cover
     from ampworks import (
         ocv, ici, gitt, dqdv, hppc, utils, datasets, mathutils, plotutils,
     )
+    from ampworks._core import (
+        Dataset, read_csv, read_excel, read_many, read_table,
+    )
 
 
 # Lazily load submodules/subpackages
@@ -68,6 +65,15 @@ _lazy_modules = {
     'plotutils': 'ampworks.plotutils',
 }
 
+# Lazily load base-level attributes (avoids importing pandas up front)
+_lazy_attrs = {
+    'Dataset': 'ampworks._core',
+    'read_csv': 'ampworks._core',
+    'read_excel': 'ampworks._core',
+    'read_many': 'ampworks._core',
+    'read_table': 'ampworks._core',
+}
+
 
 def __getattr__(name):
     import importlib
@@ -77,11 +83,17 @@ def __getattr__(name):
         globals()[name] = module  # cache for later
         return module
 
+    if name in _lazy_attrs:
+        module = importlib.import_module(_lazy_attrs[name])
+        attr = getattr(module, name)
+        globals()[name] = attr  # cache for later
+        return attr
+
     raise AttributeError(f"module {__name__} has no attribute {name}")
 
 
 def __dir__():
-    return list(globals()) + list(_lazy_modules)
+    return list(globals()) + list(_lazy_modules) + list(_lazy_attrs)
 
 
 # Check for interactive and notebook environments
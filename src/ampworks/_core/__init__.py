@@ -7,11 +7,12 @@ available at the base-level of the package.
 """
 
 from ._dataset import Dataset
-from ._read import read_csv, read_excel, read_table
+from ._read import read_csv, read_excel, read_many, read_table
 
 __all__ = [
     'Dataset',
     'read_csv',
     'read_excel',
+    'read_many',
     'read_table',
 ]
@@ -4,7 +4,6 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
-import plotly.express as px
 
 if TYPE_CHECKING:  # pragma: no cover
     import numpy.typing as npt
@@ -19,17 +18,17 @@ class Dataset(pd.DataFrame):
 
     @classmethod
     def from_csv(cls, filepath):
-        from ampworks import read_csv
+        from ._read import read_csv
         return read_csv(filepath)
 
     @classmethod
     def from_excel(cls, filepath):
-        from ampworks import read_excel
+        from ._read import read_excel
         return read_excel(filepath)
 
     @classmethod
     def from_table(cls, filepath):
-        from ampworks import read_table
+        from ._read import read_table
         return read_table(filepath)
 
     def downsample(
@@ -81,6 +80,8 @@ class Dataset(pd.DataFrame):
         figsize: npt.ArrayLike | None = (800, 450), save: str = None,
     ) -> None:
 
+        import plotly.express as px
+
         from ampworks.plotutils._style import PLOTLY_TEMPLATE
         from ampworks.plotutils._render import _render_plotly
 
@@ -1,25 +1,28 @@
 from __future__ import annotations
 
+import os
+import mmap
+
 from warnings import warn
+from contextlib import closing
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
+from ._dataset import Dataset
+
 if TYPE_CHECKING:  # pragma: no cover
     from os import PathLike
-    from ampworks import Dataset
 
 
 # Define expected headers and their aliases
 def format_alias(names: str, units: str) -> str:
 
-    aliases = units.copy()  # units only
-
-    for n in names:
-        aliases.append(f"{n}")  # name only
-
-        for u in units:
-            aliases.append(f"{n}.{u}")  # name.units
+    # units only, then each name followed by its name.units combinations
+    aliases = [*units]
+    aliases += [a for n in names for a in (n, *(f"{n}.{u}" for u in units))]
 
     return aliases
 
@@ -58,30 +61,158 @@ REQUIRED_HEADERS = ['Seconds', 'Amps', 'Volts']
 
 
 # Remove unnecessary characters from header strings
+_STRIP_TRANS = str.maketrans('(/', '..', ' _-#<>)')
+
+
+@lru_cache(maxsize=4096)
 def strip_chars(string: str) -> str:
-    transmap = str.maketrans('(/', '..', ' _-#<>)')
-    return string.lower().translate(transmap)
+    return string.lower().translate(_STRIP_TRANS)
+
+
+# Thousands separators and flags stripped from numeric columns
+_NUM_TRANS = str.maketrans('', '', '#,')
+
+
+# Normalized alias sets, built once so header checks are set intersections
+_NORMALIZED_ALIASES = {
+    k: frozenset(strip_chars(a) for a in v) for k, v in HEADER_ALIASES.items()
+}
+
+
+# Separate charge capacity/energy columns, e.g., 'Charge_Capacity(Ah)'
+_CHARGE_Q_ALIASES = frozenset('charge' + a for a in _NORMALIZED_ALIASES['Ah'])
+_CHARGE_E_ALIASES = frozenset('charge' + a for a in _NORMALIZED_ALIASES['Wh'])
+
+_DISCHARGE_Q_ALIASES = frozenset('dis' + a for a in _CHARGE_Q_ALIASES)
+_DISCHARGE_E_ALIASES = frozenset('dis' + a for a in _CHARGE_E_ALIASES)
+
+# Every normalized header used by 'standardize_headers', others are not parsed
+_ALL_WANTED = frozenset().union(
+    *_NORMALIZED_ALIASES.values(),
+    _CHARGE_Q_ALIASES, _CHARGE_E_ALIASES,
+    _DISCHARGE_Q_ALIASES, _DISCHARGE_E_ALIASES,
+)
+
+
+# Column filter for pandas readers, passed as the 'usecols' callable
+def _is_wanted(header: str) -> bool:
+    return strip_chars(str(header)) in _ALL_WANTED
 
 
 # Matches input headers with aliases of the standard headers
 def header_matches(headers: list[str], target_aliases: list[str]) -> bool:
-    headers = [strip_chars(h) for h in headers]
+    hset = {strip_chars(h) for h in headers}
+    return _normalized_matches(hset, target_aliases)
+
+
+# Same as 'header_matches', for already normalized headers. Exits on the
+# first missing target, which is the common case for non-header rows.
+def _normalized_matches(hset: set[str], target_aliases: list[str]) -> bool:
+    return all(
+        not _NORMALIZED_ALIASES[k].isdisjoint(hset) for k in target_aliases
+    )
+
+
+# Index of the first line of a delimited file that contains all required
+# headers. Lines are walked over a memory map until a match or EOF.
+def _delimited_header_row(filepath: PathLike, sep: str) -> int | None:
+    with open(filepath, 'rb') as datafile:
+        if os.fstat(datafile.fileno()).st_size == 0:  # can't mmap empty files
+            return None
+
+        mm = mmap.mmap(datafile.fileno(), 0, access=mmap.ACCESS_READ)
+        with mm:
+            idx, start = 0, 0
+            while start < len(mm):
+                end = mm.find(b'\n', start)
+                if end == -1:
+                    end = len(mm)
+
+                line = mm[start:end].rstrip(b'\r')
+                line = line.decode('utf-8', errors='ignore')
+                if header_matches(line.split(sep), REQUIRED_HEADERS):
+                    return idx
+
+                idx, start = idx + 1, end + 1
+
+    return None
+
+
+# Parses a delimited file, starting from its header row, using pyarrow. Falls
+# back to the pandas C parser for ragged files, which pads short rows with NaN
+def _read_delimited(filepath: PathLike, sep: str,
+                    skiprows: int) -> pd.DataFrame:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    read_options = pacsv.ReadOptions(skip_rows=skiprows)
+    parse_options = pacsv.ParseOptions(delimiter=sep)
+    convert_options = pacsv.ConvertOptions(
+        check_utf8=False, strings_can_be_null=True,
+    )
+
+    try:
+        table = pacsv.read_csv(
+            filepath, read_options=read_options, parse_options=parse_options,
+            convert_options=convert_options,
+        )
+    except pa.ArrowInvalid:
+        return pd.read_csv(filepath, sep=sep, skiprows=skiprows,
+                           usecols=_is_wanted, encoding_errors='ignore')
+
+    # Only convert columns that 'standardize_headers' can use. Repeated names
+    # keep their first column, pandas renames later ones (e.g., 'X.1')
+    keep, seen = [], set()
+    for i, name in enumerate(table.column_names):
+        if _is_wanted(name) and name not in seen:
+            keep.append(i)
+            seen.add(name)
+
+    return table.select(keep).to_pandas(types_mapper=pd.ArrowDtype)
+
+
+# Index of the first preview row that contains all required headers
+def _find_header_row(preview: pd.DataFrame) -> int | None:
+    if preview.empty:
+        return None
+
+    norm = preview.fillna('').astype(str).apply(
+        lambda col: col.str.lower().str.translate(_STRIP_TRANS),
+    )
+
+    for idx, row in enumerate(norm.to_numpy()):
+        if _normalized_matches(set(row), REQUIRED_HEADERS):
+            return idx
+
+    return None
 
-    checks = {}
-    for k in target_aliases:
-        if any(alias in headers for alias in HEADER_ALIASES[k]):
-            checks[k] = True
-        else:
-            checks[k] = False
 
-    return all(checks.values())
+# Prefer the faster (Rust-based) 'calamine' engine for excel, when installed
+@lru_cache(maxsize=None)
+def _excel_engine() -> str | None:
+    from importlib.util import find_spec
+
+    # pandas only ships the 'calamine' engine from v2.2 onward
+    major, minor = (int(v) for v in pd.__version__.split('.')[:2])
+    if (major, minor) >= (2, 2) and find_spec('python_calamine') is not None:
+        return 'calamine'
+
+    return None  # let pandas pick its default engine
+
+
+# Index of the first worksheet row (of 20) that contains all required headers
+def _xlsx_header_row(worksheet) -> int | None:
+    rows = worksheet.iter_rows(max_row=20, values_only=True)
+    for idx, row in enumerate(rows):
+        if header_matches([str(v) for v in row], REQUIRED_HEADERS):
+            return idx
+
+    return None
 
 
 # Standardizes the column header names and the data units
 def standardize_headers(data: pd.DataFrame) -> Dataset:
-    from ampworks import Dataset
-
-    df = Dataset()
+    from pandas.api.types import is_numeric_dtype
 
     UNIT_FACTORS = {
         'Amps': {
@@ -96,51 +227,58 @@ def standardize_headers(data: pd.DataFrame) -> Dataset:
         },
     }
 
+    # Normalize as-imported headers once, preserving the column order
+    norm_cols = {h1: strip_chars(h1) for h1 in data.columns}
+
     # Match as-imported headers with standardized headers
+    cols = {}
     for std_header in HEADER_ALIASES.keys():
-        for h1 in data.columns:
-            h2 = strip_chars(h1)
-            if h2 not in HEADER_ALIASES[std_header]:
+        aliases = _NORMALIZED_ALIASES[std_header]
+        for h1, h2 in norm_cols.items():
+            if h2 not in aliases:
                 continue
 
-            df[std_header] = data[h1]
+            cols[std_header] = data[h1]
 
             # Standardize units
             if std_header in UNIT_FACTORS.keys():
                 for units, factor in UNIT_FACTORS[std_header].items():
                     if any(u in h2 for u in units):
-                        df[std_header] = df[std_header].astype(float)*factor
+                        cols[std_header] = data[h1].astype(float)*factor
                         break
 
+    # Build the dataset once, rather than inserting columns one at a time
+    df = Dataset(cols, copy=False)
+
     # Create 'State' data if not present
     if ('State' not in df.columns) and ('Amps' in df.columns):
-        df['Amps'] = df['Amps'].astype(float)
+        amps = df['Amps'].to_numpy(dtype=float)
 
-        df['State'] = 'R'
-        df.loc[df['Amps'] > 0, 'State'] = 'C'
-        df.loc[df['Amps'] < 0, 'State'] = 'D'
+        df['Amps'] = amps
+        df['State'] = np.select([amps > 0, amps < 0], ['C', 'D'], default='R')
 
     # Guarantee sign 'Amps' sign convention (+ charge, - discharge)
     if 'State' in df.columns:
-        df['Amps'] = df['Amps'].astype(float)
+        state = df['State'].astype(str).to_numpy()
+        amps = df['Amps'].to_numpy(dtype=float)
 
-        sign = df['State'].map({'R': 0., 'C': +1, 'D': -1}).fillna(1)
-        df['Amps'] = sign*df['Amps'].abs()
+        sign = np.select([state == 'R', state == 'D'], [0., -1.], default=1.)
+        df['Amps'] = sign*np.abs(amps)
 
     # Create 'Ah' and 'Wh' from separate charge and discharge columns
-    if any(h not in df.columns for h in ['Ah', 'Wh']):
-        Q_headers = ['charge' + h for h in HEADER_ALIASES['Ah']]
-        E_headers = ['charge' + h for h in HEADER_ALIASES['Wh']]
-        for h1 in data.columns:
-            h2 = strip_chars(h1)
-            if h2 in Q_headers:
-                df['Ah'] = data[h1]
+    has_state = 'State' in df.columns
+    if has_state and any(h not in df.columns for h in ['Ah', 'Wh']):
+        is_d = state == 'D'
+
+        for h1, h2 in norm_cols.items():
+            if h2 in _CHARGE_Q_ALIASES:
+                charge_Ah = data[h1].to_numpy()
                 discharge_Ah = data[h1.replace('Charge', 'Discharge')]
-                df.loc[df['State'] == 'D', 'Ah'] = discharge_Ah
-            if h2 in E_headers:
-                df['Wh'] = data[h1]
+                df['Ah'] = np.where(is_d, discharge_Ah.to_numpy(), charge_Ah)
+            if h2 in _CHARGE_E_ALIASES:
+                charge_Wh = data[h1].to_numpy()
                 discharge_Wh = data[h1.replace('Charge', 'Discharge')]
-                df.loc[df['State'] == 'D', 'Wh'] = discharge_Wh
+                df['Wh'] = np.where(is_d, discharge_Wh.to_numpy(), charge_Wh)
 
     # Final data typing, unit normalization, and checks for missing headers
     missing = []
@@ -152,10 +290,12 @@ def standardize_headers(data: pd.DataFrame) -> Dataset:
                 df[std_header] = df[std_header].astype(str)
             elif std_header in ['Cycle', 'Step']:
                 df[std_header] = df[std_header].astype(int)
-            else:
-                df[std_header] = df[std_header].replace('#', '', regex=True)
-                df[std_header] = df[std_header].replace(',', '', regex=True)
+            elif is_numeric_dtype(df[std_header]):
                 df[std_header] = df[std_header].astype(float)
+            else:
+                values = df[std_header].astype(str).str.translate(_NUM_TRANS)
+                values = pd.to_numeric(values, errors='coerce')
+                df[std_header] = values.astype(float)
         else:
             missing.append(std_header)
 
@@ -168,21 +308,11 @@ def standardize_headers(data: pd.DataFrame) -> Dataset:
 def read_table(filepath: PathLike) -> Dataset:
     """Read tab-delimited file."""
 
-    from ampworks import Dataset
-
-    with open(filepath, encoding='utf-8') as datafile:
-
-        skiprows, found_header = 0, False
-        for idx, line in enumerate(datafile):
-            if header_matches(line.rstrip('\n').split('\t'), REQUIRED_HEADERS):
-                skiprows, found_header = idx, True
-                break
+    skiprows = _delimited_header_row(filepath, sep='\t')
+    if skiprows is not None:
+        df = _read_delimited(filepath, sep='\t', skiprows=skiprows)
 
-        if found_header:
-            df = pd.read_csv(filepath, sep='\t', skiprows=skiprows,
-                             encoding_errors='ignore')
-
-            return standardize_headers(df)
+        return standardize_headers(df)
 
     warn(f"No valid headers found in {filepath}")
     return Dataset()
@@ -192,10 +322,17 @@ def read_excel(filepath: PathLike, sheet_name: str | int | list = 'first',
                stack_sheets: bool = False) -> Dataset:
     """Read excel file."""
 
-    from ampworks import Dataset
+    # Stream xlsx rows with openpyxl to sniff headers, pandas for legacy xls
+    is_xlsx = str(filepath).lower().endswith(('.xlsx', '.xlsm'))
+    if is_xlsx:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(filepath, read_only=True, data_only=True)
+        all_sheets = workbook.sheetnames
+    else:
+        workbook = pd.ExcelFile(filepath, engine=_excel_engine())
+        all_sheets = workbook.sheet_names
 
-    workbook = pd.ExcelFile(filepath)
-    all_sheets = workbook.sheet_names
     num_sheets = len(all_sheets)
 
     # Warn if any sheet conflicts with 'first' or 'all'
@@ -226,26 +363,40 @@ def read_excel(filepath: PathLike, sheet_name: str | int | list = 'first',
     if others:
         raise TypeError("'sheet_name' must only contain str and/or int types")
 
-    # Iterate through select sheets
+    # Locate header rows, scanning only the leading rows of each sheet
     failed = []
-    datasets = {}
-    for sheet in iter_sheets:
-        preview = workbook.parse(sheet, header=None, nrows=20, dtype=str)
-
-        # Find header row
-        header_row = None
-        for idx, row in preview.iterrows():
-            if header_matches(row.values.astype(str), REQUIRED_HEADERS):
-                header_row = idx
-                break
+    header_rows = {}
+    with closing(workbook):
+        for sheet in iter_sheets:
 
-        if header_row is not None:
-            df = workbook.parse(sheet, header=header_row)
-            datasets[sheet] = standardize_headers(df)
+            if is_xlsx:
+                name = all_sheets[sheet] if isinstance(sheet, int) else sheet
+                header_row = _xlsx_header_row(workbook[name])
+            else:
+                preview = workbook.parse(sheet, header=None, nrows=20,
+                                         dtype=str)
+                header_row = _find_header_row(preview)
+
+            if header_row is None:
+                failed.append(sheet)
+                continue
+
+            header_rows[sheet] = header_row
             if sheet_name == 'first':
                 break
+
+        # Parse sheets with valid headers, sharing one open workbook
+        datasets = {}
+        if header_rows and is_xlsx:
+            engine = _excel_engine() or 'openpyxl'
+            excel = pd.ExcelFile(filepath, engine=engine)
         else:
-            failed.append(sheet)
+            excel = workbook  # legacy xls file is already open
+
+        with closing(excel):
+            for sheet, header_row in header_rows.items():
+                df = excel.parse(sheet, header=header_row, usecols=_is_wanted)
+                datasets[sheet] = standardize_headers(df)
 
     # Prepare outputs
     if sheet_name != 'first' and failed:
@@ -269,21 +420,47 @@ def read_excel(filepath: PathLike, sheet_name: str | int | list = 'first',
 def read_csv(filepath: PathLike) -> Dataset:
     """Read csv file."""
 
-    from ampworks import Dataset
+    skiprows = _delimited_header_row(filepath, sep=',')
+    if skiprows is not None:
+        df = _read_delimited(filepath, sep=',', skiprows=skiprows)
 
-    with open(filepath, encoding='utf-8') as datafile:
+        return standardize_headers(df)
 
-        skiprows, found_header = 0, False
-        for idx, line in enumerate(datafile):
-            if header_matches(line.rstrip('\n').split(','), REQUIRED_HEADERS):
-                skiprows, found_header = idx, True
-                break
+    warn(f"No valid headers found in {filepath}")
+    return Dataset()
 
-        if found_header:
-            df = pd.read_csv(filepath, sep=',', skiprows=skiprows,
-                             encoding_errors='ignore')
 
-            return standardize_headers(df)
+def read_many(filepaths: list[PathLike],
+              max_workers: int | None = None) -> list[Dataset]:
+    """
+    Read many csv files in parallel.
 
-    warn(f"No valid headers found in {filepath}")
-    return Dataset()
+    Parameters
+    ----------
+    filepaths : list[PathLike]
+        Paths to csv files. Each is read using `read_csv`.
+    max_workers : int or None, optional
+        Maximum number of worker processes. If None (default), the number of
+        processors on the machine is used.
+
+    Returns
+    -------
+    datasets : list[Dataset]
+        Datasets in the same order as `filepaths`.
+
+    Notes
+    -----
+    Files are read in separate processes, so any warnings raised by the reader
+    (e.g., missing headers) are not propagated back to the calling process.
+
+    On platforms that start processes with 'spawn' (Windows and macOS), each
+    worker re-imports the calling script's `__main__` module. Scripts must
+    therefore call `read_many` from inside an ``if __name__ == '__main__':``
+    block. Otherwise, the workers try to start their own pools and fail.
+
+    """
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(read_csv, filepaths, chunksize=4))
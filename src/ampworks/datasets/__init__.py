@@ -70,7 +70,7 @@ def download_all(path: str | os.PathLike | None = None) -> None:
         orig = os.path.join(resources, name)
         new = os.path.join(path, name)
 
-        shutil.copy(orig, new)
+        shutil.copyfile(orig, new)
 
 
 def load_datasets(*names: str) -> Dataset:
@@ -94,12 +94,13 @@ def load_datasets(*names: str) -> Dataset:
         Requested dataset is not available.
 
     """
-    from ampworks import read_csv
+    from concurrent.futures import ThreadPoolExecutor
+    from ampworks._core._read import read_csv
 
     available = list_datasets()
     resources = pathlib.Path(os.path.dirname(__file__), 'resources')
 
-    datasets = []
+    filepaths = []
     for name in names:
 
         if not name.endswith('.csv'):
@@ -108,11 +109,18 @@ def load_datasets(*names: str) -> Dataset:
         if name not in available:
             raise ValueError(f"{name} is not an available dataset.")
 
-        with catch_warnings():
-            filterwarnings('ignore', message='.*No valid headers.*')
-            data = read_csv(resources.joinpath(name))
+        filepaths.append(resources.joinpath(name))
 
-        datasets.append(data)
+    # pyarrow parses outside the GIL, so files can be read concurrently
+    max_workers = min(len(filepaths), os.cpu_count() or 1)
+    with catch_warnings():
+        filterwarnings('ignore', message='.*No valid headers.*')
+
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                datasets = list(executor.map(read_csv, filepaths))
+        else:
+            datasets = [read_csv(filepath) for filepath in filepaths]
 
     if len(datasets) == 1:
         return datasets[0]
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import warnings
-
-from numbers import Real
+from numbers import Real, Integral
+from functools import lru_cache
 from typing import Callable, Iterable, TYPE_CHECKING
 
 import numpy as np
@@ -23,6 +22,7 @@ class DqdvFitter:
     def __init__(
         self, neg: pd.DataFrame = None, pos: pd.DataFrame = None,
         cell: pd.DataFrame = None, cost_terms: str | list[str] = 'all',
+        n_soc: int = 201,
     ) -> None:
         """
         Wrapper for dQdV fitting.
@@ -56,6 +56,9 @@ class DqdvFitter:
         cost_terms : str or list[str], optional
             Error terms for optimization. 'all' (default) = ['voltage', 'dqdv',
             'dvdq']. Accepts a string (single term) or list (subset of terms).
+        n_soc : int, optional
+            Number of evenly spaced relative state-of-charge points used to
+            compare fits against the full cell data. Defaults to 201.
 
         Notes
         -----
@@ -66,11 +69,17 @@ class DqdvFitter:
           addition to the x0/x1 stoichiometries. Otherwise, the ohmic iR offset
           is forced to 0. `cost_terms` can be modified after initialization
           via its property.
+        * A coarser `n_soc` makes each cost evaluation cheaper, e.g., for a
+          quick `grid_search`. It can also be changed via its property, so a
+          final `constrained_fit` can be run on the full resolution grid.
 
         """
 
+        self._splines = {}
         self._initialized = {}
 
+        self.n_soc = n_soc
+
         self.neg = neg
         self.pos = pos
         self.cell = cell
@@ -138,11 +147,7 @@ class DqdvFitter:
         self._ocv_c, self._dvdq_c = self._build_splines(self._cell, 'cell')
 
         if self._initialized['cell']:
-            self._soc = np.linspace(0., 1., 201)
-
-            self._volt_data = self._ocv_c(self._soc)
-            self._dvdq_data = self._dvdq_c(self._soc)
-            self._dqdv_data = 1 / self._dvdq_data
+            self._eval_cell_data()
 
     @property
     def cost_terms(self) -> list[str]:
@@ -177,6 +182,43 @@ class DqdvFitter:
 
         self._cost_terms = value
 
+    @property
+    def n_soc(self) -> int:
+        """
+        Get or set the number of relative state-of-charge points used to
+        compare fits against the full cell data. Must be an int >= 2.
+
+        """
+        return self._soc.size
+
+    @n_soc.setter
+    def n_soc(self, value: int) -> None:
+
+        if not isinstance(value, Integral) or isinstance(value, bool):
+            raise TypeError("n_soc must be type int.")
+
+        if value < 2:
+            raise ValueError("n_soc must be at least 2.")
+
+        self._soc = _soc_grid(int(value))
+
+        if self._initialized.get('cell', False):
+            self._eval_cell_data()
+
+    def _eval_cell_data(self) -> None:
+        """
+        Evaluate and cache full cell data on the relative state-of-charge grid.
+        Also stores reciprocals so cost functions multiply instead of divide.
+        Note that the dqdv and dvdq data are already reciprocals of each other.
+
+        """
+
+        self._volt_data = self._ocv_c(self._soc)
+        self._dvdq_data = self._dvdq_c(self._soc)
+        self._dqdv_data = 1 / self._dvdq_data
+
+        self._inv_volt_data = 1 / self._volt_data
+
     def _check_dataframe(self, df: pd.DataFrame, which: str) -> pd.DataFrame:
         """
         Verify that input dataframes have 'Ah' and 'Volts' columns.
@@ -234,15 +276,22 @@ class DqdvFitter:
         """
 
         if df is None:
+            self._splines[which] = (None, None)
             return None, None
 
-        _, mask = np.unique(df.soc, return_index=True)
+        soc = df['soc'].to_numpy(dtype=float)
+        voltage = df['voltage'].to_numpy(dtype=float)
 
-        df = df.iloc[mask].reset_index(drop=True)
+        # sorted unique soc, keeping the first voltage at any repeated soc
+        soc, index = np.unique(soc, return_index=True)
 
-        ocv = interp.make_splrep(df.soc, df.voltage)
+        spline = interp.make_splrep(soc, voltage[index])
+
+        # piecewise polynomials evaluate faster in the cost function hot path
+        ocv = interp.PPoly.from_spline(spline)
         dvdq = ocv.derivative()
 
+        self._splines[which] = (ocv, dvdq)
         self._initialized[which] = True
 
         return ocv, dvdq
@@ -269,6 +318,64 @@ class DqdvFitter:
             raise RuntimeError(f"Can't run '{func_name}' until all data is"
                                f" available. Missing {missing} data.")
 
+    def _eval_fits(self, params: npt.ArrayLike) -> tuple[np.ndarray]:
+        """
+        Evaluate the model voltage and dvdq curves over the cell 'soc' grid.
+
+        Parameters
+        ----------
+        params : ArrayLike, shape(n,)
+            Array for xn0, xn1, xp0, xp1, and optionally iR.
+
+        Returns
+        -------
+        volt_fit, dvdq_fit : tuple[np.ndarray]
+            Model voltage and dvdq arrays, aligned with the cell 'soc' grid.
+
+        """
+
+        # clip scalars directly, avoids temp arrays and editing 'params'
+        xn0, xn1, xp0, xp1 = [min(1., max(0., p)) for p in params[:4]]
+        iR = params[4] if len(params) == 5 else 0.
+
+        x_neg = xn0 + (xn1 - xn0) * self._soc
+        x_pos = xp0 + (xp1 - xp0) * self._soc
+
+        dxp_dx = xp1 - xp0  # for chain rule w.r.t. x_pos -> soc below
+        dxn_dx = xn1 - xn0  # for chain rule w.r.t. x_neg -> soc below
+
+        volt_fit = self._ocv_p(x_pos) - self._ocv_n(x_neg) - iR
+        dvdq_fit = self._dvdq_p(x_pos)*dxp_dx - self._dvdq_n(x_neg)*dxn_dx
+
+        return volt_fit, dvdq_fit
+
+    def _err_scalars(self, volt_fit: np.ndarray, dqdv_fit: np.ndarray,
+                     dvdq_fit: np.ndarray) -> tuple[float]:
+        """
+        Mean absolute fractional errors between the fits and the cell data.
+
+        Parameters
+        ----------
+        volt_fit, dqdv_fit, dvdq_fit : np.ndarray
+            Model voltage, dqdv, and dvdq arrays from the fit.
+
+        Returns
+        -------
+        volt_err, dqdv_err, dvdq_err : tuple[float]
+            Voltage, dqdv, and dvdq errors as fractions (not percents).
+
+        """
+
+        volt_data = self._volt_data
+        dqdv_data = self._dqdv_data
+        dvdq_data = self._dvdq_data
+
+        volt_err = _mape(volt_fit, volt_data, self._inv_volt_data)
+        dqdv_err = _mape(dqdv_fit, dqdv_data, dvdq_data)
+        dvdq_err = _mape(dvdq_fit, dvdq_data, dqdv_data)
+
+        return volt_err, dqdv_err, dvdq_err
+
     def _err_func(self, params: npt.ArrayLike) -> float:
         """
         The cost function for 'grid_search' and 'constrained_fit'.
@@ -285,15 +392,66 @@ class DqdvFitter:
 
         """
 
-        errs = self.err_terms(params)
+        volt_fit, dvdq_fit = self._eval_fits(params)
+
+        errs = self._err_scalars(volt_fit, 1 / dvdq_fit, dvdq_fit)
+        volt_err, dqdv_err, dvdq_err = errs
+
+        err_total = 0.  # faster when MAPE is fractional, not percents
+        if 'voltage' in self.cost_terms:
+            err_total += volt_err
+        if 'dqdv' in self.cost_terms:
+            err_total += dqdv_err
+        if 'dvdq' in self.cost_terms:
+            err_total += dvdq_err
+
+        return err_total
+
+    def _batch_err_func(self, params: npt.ArrayLike) -> np.ndarray:
+        """
+        Vectorized 'err_func' for many parameter sets at once, with iR = 0.
+
+        Parameters
+        ----------
+        params : ArrayLike, shape(m, 4)
+            Rows of xn0, xn1, xp0, and xp1 values.
+
+        Returns
+        -------
+        err_total : np.ndarray, shape(m,)
+            Total error of each row based on a combination of cost_terms.
 
-        err_total = 0.  # faster when MAPE is fractional, so use (*1e-2) below
+        """
+
+        params = np.clip(params, 0., 1.)
+        xn0, xn1, xp0, xp1 = params.T[:, :, None]
+
+        x_neg = xn0 + (xn1 - xn0) * self._soc
+        x_pos = xp0 + (xp1 - xp0) * self._soc
+
+        err_total = np.zeros(params.shape[0])
         if 'voltage' in self.cost_terms:
-            err_total += errs['volt_err']*1e-2
+            volt_data = self._volt_data
+            volt_fit = self._ocv_p(x_pos) - self._ocv_n(x_neg)
+
+            rel_err = np.abs((volt_fit - volt_data)*self._inv_volt_data)
+            err_total += np.mean(rel_err, axis=1)
+
+        if not {'dqdv', 'dvdq'}.isdisjoint(self.cost_terms):
+            dvdq_fit = self._dvdq_p(x_pos)*(xp1 - xp0) \
+                - self._dvdq_n(x_neg)*(xn1 - xn0)
+
         if 'dqdv' in self.cost_terms:
-            err_total += errs['dqdv_err']*1e-2
+            dqdv_data = self._dqdv_data
+
+            rel_err = np.abs((1 / dvdq_fit - dqdv_data)*self._dvdq_data)
+            err_total += np.mean(rel_err, axis=1)
+
         if 'dvdq' in self.cost_terms:
-            err_total += errs['dvdq_err']*1e-2
+            dvdq_data = self._dvdq_data
+
+            rel_err = np.abs((dvdq_fit - dvdq_data)*self._dqdv_data)
+            err_total += np.mean(rel_err, axis=1)
 
         return err_total
 
@@ -341,10 +499,12 @@ class DqdvFitter:
 
         """
 
-        if which not in ['neg', 'pos', 'cell']:
-            raise ValueError("'which' must be in ['neg', 'pos', 'cell'].")
+        try:
+            spline, _ = self._splines[which]
+        except (KeyError, TypeError):
+            msg = "'which' must be in ['neg', 'pos', 'cell']."
+            raise ValueError(msg) from None
 
-        spline = getattr(self, f"_ocv_{which[0]}")
         if spline is None:
             raise RuntimeError(f"'{which}' splines are not constructed yet."
                                f" Set the '{which}' property first.")
@@ -383,10 +543,12 @@ class DqdvFitter:
 
         """
 
-        if which not in ['neg', 'pos', 'cell']:
-            raise ValueError("'which' must be in ['neg', 'pos', 'cell'].")
+        try:
+            _, spline = self._splines[which]
+        except (KeyError, TypeError):
+            msg = "'which' must be in ['neg', 'pos', 'cell']."
+            raise ValueError(msg) from None
 
-        spline = getattr(self, f"_dvdq_{which[0]}")
         if spline is None:
             raise RuntimeError(f"'{which}' splines are not constructed yet."
                                f" Set the '{which}' property first.")
@@ -454,32 +616,15 @@ class DqdvFitter:
 
         self._check_initialized('err_terms')
 
-        params = np.asarray(params)
-        params[:4] = np.clip(params[:4], 0., 1.)
-
-        if params.size == 5:
-            xn0, xn1, xp0, xp1, iR = params
-        else:
-            xn0, xn1, xp0, xp1, iR = *params, 0.
-
-        x_neg = xn0 + (xn1 - xn0) * self._soc
-        x_pos = xp0 + (xp1 - xp0) * self._soc
-
-        dxp_dx = xp1 - xp0  # for chain rule w.r.t. x_pos -> soc below
-        dxn_dx = xn1 - xn0  # for chain rule w.r.t. x_neg -> soc below
-
-        volt_fit = self._ocv_p(x_pos) - self._ocv_n(x_neg) - iR
-
-        dvdq_fit = self._dvdq_p(x_pos)*dxp_dx - self._dvdq_n(x_neg)*dxn_dx
+        volt_fit, dvdq_fit = self._eval_fits(params)
         dqdv_fit = 1 / dvdq_fit
 
         volt_data = self._volt_data
         dqdv_data = self._dqdv_data
         dvdq_data = self._dvdq_data
 
-        volt_err = np.mean(np.abs((volt_fit - volt_data) / volt_data))
-        dqdv_err = np.mean(np.abs((dqdv_fit - dqdv_data) / dqdv_data))
-        dvdq_err = np.mean(np.abs((dvdq_fit - dvdq_data) / dvdq_data))
+        errs = self._err_scalars(volt_fit, dqdv_fit, dvdq_fit)
+        volt_err, dqdv_err, dvdq_err = errs
 
         # attempt at using relative MSE, non-trivial to figure out scaling...
         # volt_scale = np.maximum(volt_data, volt_data.mean())
@@ -523,27 +668,21 @@ class DqdvFitter:
 
         """
         from ampworks.dqdv import DqdvFitResult
-        from ampworks.mathutils import combinations
 
         self._check_initialized('grid_search')
 
-        span = np.linspace(0., 1., Nx)
         names = ['xn0', 'xn1', 'xp0', 'xp1', 'iR']
+        valid_ps = _grid_points(Nx)
 
-        params = combinations([span] * 4, names=names)
-
-        valid_ps = []
-        for p in params:
-            if p['xn0'] < p['xn1'] and p['xp0'] < p['xp1']:
-                valid_ps.append(p)
-
-        errs = np.zeros(len(valid_ps))
-        for i, p in enumerate(valid_ps):
-            values = np.fromiter(p.values(), dtype=float)
-            errs[i] = self._err_func(values)
+        # evaluate in batches to bound the size of the (batch, soc) arrays
+        batch = 2048
+        errs = np.concatenate([
+            self._batch_err_func(valid_ps[i:i + batch])
+            for i in range(0, len(valid_ps), batch)
+        ])
 
         index = np.argmin(errs)
-        x_opt = np.fromiter(valid_ps[index].values(), dtype=float)
+        x_opt = valid_ps[index]
 
         fit_result = DqdvFitResult(
             success=True,
@@ -560,10 +699,11 @@ class DqdvFitter:
 
     def constrained_fit(
         self, x0: npt.ArrayLike, bounds: float | list[float] = 0.1,
-        xtol: float = 1e-8, maxiter: int = 100000, return_full: bool = False,
+        ftol: float = 1e-8, maxiter: int = 100000, return_full: bool = False,
+        xtol: float | None = None,
     ) -> DqdvFitResult:
         """
-        Run a trust-constrained local optimization routine to minimize error
+        Run a constrained local optimization routine (SLSQP) to minimize error
         between the fit and data.
 
         Parameters
@@ -574,13 +714,17 @@ class DqdvFitter:
         bounds : float or list[float], optional
             Symmetric parameter bounds (excludes iR). A float (default=0.1)
             applies to all. Use lists for per-x values. See notes for more info.
-        xtol : float, optional
-            Convergence tolerance for parameters. Defaults to 1e-8.
+        ftol : float, optional
+            Convergence tolerance, passed to SLSQP as its 'ftol' option, i.e.,
+            the precision goal for the cost function. Defaults to 1e-8.
         maxiter : int, optional
             Maximum number of iteraterations. Defaults to 1e5.
         return_full : bool, optional
             If True, include the complete `OptimizeResult` from SciPy in the
             output. Defaults to False.
+        xtol : float or None, optional
+            Deprecated, use `ftol` instead. SLSQP has no parameter tolerance,
+            so a given value is used as `ftol`, a tolerance on the cost.
 
         Returns
         -------
@@ -591,6 +735,11 @@ class DqdvFitter:
             Full result form SciPy. Does not include standard deviation info.
             Only returned if `return_full=True`.
 
+        Warns
+        -----
+        DeprecationWarning
+            'xtol' is deprecated and will be removed, use 'ftol' instead.
+
         Notes
         -----
         Bound indices correspond to xn0, xn1, xp0, and xp1, where 0 and 1 are
@@ -625,12 +774,22 @@ class DqdvFitter:
             12-nonlinear-regression-2.html
 
         """
-        from numdifftools import Hessian
         from ampworks.dqdv import DqdvFitResult
 
         self._check_initialized('constrained_fit')
 
-        x0 = np.asarray(x0)
+        if xtol is not None:
+            from warnings import warn
+
+            warn("'xtol' is deprecated and will be removed, use 'ftol'. SLSQP"
+                 " applies it to the cost function, not the parameters.",
+                 DeprecationWarning, stacklevel=2)
+
+            ftol = xtol
+
+        x0 = np.array(x0, dtype=float)
+        x0[:4] = np.clip(x0[:4], 0., 1.)
+
         eps = np.finfo(x0.dtype).eps
 
         # check and build bounds
@@ -675,47 +834,42 @@ class DqdvFitter:
         constraints = [constr_neg, constr_pos]
 
         options = {
-            'xtol': xtol,
+            'ftol': ftol,
             'maxiter': maxiter,
         }
 
-        warnings.filterwarnings('ignore', 'delta_grad == 0.0')
-
-        opt_result = opt.minimize(self._err_func, x0, method='trust-constr',
+        opt_result = opt.minimize(self._err_func, x0, method='SLSQP',
                                   bounds=bounds, constraints=constraints,
                                   options=options)
 
-        warnings.filterwarnings('default')
-
         # Use Hessian to approximate variance. Requires SSR error function.
         # An added diagonal scaling stabilizes inversion (avoids non-singular).
 
         def ssr(x: npt.ArrayLike) -> float:  # sum of squared residuals
 
-            errs = self.err_terms(x)
-
-            volt_err = np.sum((errs['volt_fit'] - errs['volt_data'])**2)
-            dqdv_err = np.sum((errs['dqdv_fit'] - errs['dqdv_data'])**2)
-            dvdq_err = np.sum((errs['dvdq_fit'] - errs['dvdq_data'])**2)
+            volt_fit, dvdq_fit = self._eval_fits(x)
 
             ssr = 0.
             if 'voltage' in self.cost_terms:
-                ssr += volt_err
+                ssr += np.sum((volt_fit - self._volt_data)**2)
             if 'dqdv' in self.cost_terms:
-                ssr += dqdv_err
+                ssr += np.sum((1 / dvdq_fit - self._dqdv_data)**2)
             if 'dvdq' in self.cost_terms:
-                ssr += dvdq_err
+                ssr += np.sum((dvdq_fit - self._dvdq_data)**2)
 
             return ssr
 
-        opt_result.hess = Hessian(ssr)(opt_result.x)
-
-        evals, _ = np.linalg.eig(opt_result.hess)
-        scale = 1e-16*np.max(np.abs(evals))
+        opt_result.hess = _hessian(ssr, opt_result.x)
 
+        # The Hessian is symmetric, so invert (H + scale*I) via eigh and reuse
+        # the same decomposition for the diagonal scaling
         try:
-            size = opt_result.x.size
-            cov = np.linalg.inv(opt_result.hess + scale*np.eye(size))
+            evals, evecs = np.linalg.eigh(opt_result.hess)
+            scale = 1e-16*np.max(np.abs(evals))
+
+            with np.errstate(divide='raise'):
+                cov = (evecs / (evals + scale)) @ evecs.T
+
             std = np.sqrt(0.5*np.abs(np.diag(cov)))
         except Exception:
             std = None
@@ -730,7 +884,7 @@ class DqdvFitter:
             success=opt_result.success,
             message=opt_result.message,
             nfev=opt_result.nfev,
-            niter=opt_result.niter,
+            niter=opt_result.nit,
             fun=opt_result.fun,
             x=opt_result.x,
             x_std=std,
@@ -836,3 +990,128 @@ class DqdvFitter:
             format_ticks(ax, xdiv=2, ydiv=2)
 
         _ExitHandler.register_atexit(plt.show)
+
+
+def _hessian(func: Callable, x: npt.ArrayLike) -> np.ndarray:
+    """
+    Approximate the Hessian of a scalar function using central differences.
+
+    Parameters
+    ----------
+    func : Callable
+        Scalar function with signature ``func(x) -> float``.
+    x : ArrayLike, shape(n,)
+        Point at which to evaluate the Hessian.
+
+    Returns
+    -------
+    hess : np.ndarray, shape(n, n)
+        Symmetric Hessian matrix, from 2n(n - 1) + 2n + 1 function evaluations.
+
+    """
+
+    x = np.asarray(x, dtype=float)
+    eps = np.finfo(float).eps
+
+    n = x.size
+    h = eps**0.25 * np.maximum(1., np.abs(x))
+    steps = np.diag(h)
+
+    f0 = func(x.copy())
+    hess = np.zeros((n, n))
+    for i in range(n):
+        fp = func(x + steps[i])
+        fm = func(x - steps[i])
+        hess[i, i] = (fp - 2.*f0 + fm) / h[i]**2
+
+        for j in range(i + 1, n):
+            fpp = func(x + steps[i] + steps[j])
+            fpm = func(x + steps[i] - steps[j])
+            fmp = func(x - steps[i] + steps[j])
+            fmm = func(x - steps[i] - steps[j])
+
+            hess[i, j] = (fpp - fpm - fmp + fmm) / (4.*h[i]*h[j])
+            hess[j, i] = hess[i, j]
+
+    return hess
+
+
+def _mape(fit: np.ndarray, data: np.ndarray, inv_data: np.ndarray) -> float:
+    """
+    Mean absolute fractional error, computed in place on a single temporary.
+
+    Parameters
+    ----------
+    fit : np.ndarray
+        Model values.
+    data : np.ndarray
+        Target values, same shape as `fit`.
+    inv_data : np.ndarray
+        Precomputed reciprocal of `data`.
+
+    Returns
+    -------
+    mape : float
+        Mean of ``abs((fit - data) / data)``, as a fraction (not percent).
+
+    """
+
+    err = np.subtract(fit, data)
+    err *= inv_data
+
+    return np.abs(err, out=err).sum() / err.size
+
+
+@lru_cache(maxsize=8)
+def _soc_grid(n_soc: int) -> np.ndarray:
+    """
+    Read-only relative state-of-charge grid, shared between fitter instances.
+
+    Parameters
+    ----------
+    n_soc : int
+        Number of evenly spaced points between [0, 1].
+
+    Returns
+    -------
+    soc : np.ndarray, shape(n_soc,)
+        Read-only grid. Callers receive it via `err_terms`, so it is locked
+        to prevent in-place edits from affecting other instances.
+
+    """
+
+    soc = np.linspace(0., 1., n_soc)
+    soc.flags.writeable = False
+
+    return soc
+
+
+@lru_cache(maxsize=8)
+def _grid_points(Nx: int) -> np.ndarray:
+    """
+    Valid 'grid_search' parameter sets, cached for repeated calls with Nx.
+
+    Parameters
+    ----------
+    Nx : int
+        Number of discretizations between [0, 1] for each parameter.
+
+    Returns
+    -------
+    params : np.ndarray, shape(m, 4)
+        Read-only rows of xn0, xn1, xp0, and xp1, where xn0 < xn1 and xp0 <
+        xp1. Rows follow the same order as `itertools.product`.
+
+    """
+
+    span = np.linspace(0., 1., Nx)
+
+    grid = np.meshgrid(span, span, span, span, indexing='ij')
+    params = np.column_stack([g.ravel() for g in grid])
+
+    valid = (params[:, 0] < params[:, 1]) & (params[:, 2] < params[:, 3])
+
+    params = params[valid]
+    params.flags.writeable = False
+
+    return params
@@ -4,8 +4,7 @@ from typing import TYPE_CHECKING
 import numpy as np
 import matplotlib.pyplot as plt
 
-from scipy.interpolate import make_splrep
-from scipy.integrate import cumulative_trapezoid
+from scipy.interpolate import PPoly, make_splrep
 
 if TYPE_CHECKING:  # pragma: no cover
     from typing import Self
@@ -45,7 +44,8 @@ class DqdvSpline:
             Root mean square error between smoothed and raw voltages.
 
         """
-        pass
+        self._volts = None
+        self._dvdq = None
 
     def fit(self, data: amp.Dataset, s: float = 0.) -> Self:
         """
@@ -94,38 +94,47 @@ class DqdvSpline:
         decreasing (discharging).
 
         """
-        data = data.reset_index(drop=True)
+        seconds = data['Seconds'].to_numpy(dtype=float)
+        amps = data['Amps'].to_numpy(dtype=float)
+        volts = data['Volts'].to_numpy(dtype=float)
 
-        # add Ah and SOC columns
-        is_net_charge = data['Volts'].iloc[0] < data['Volts'].iloc[-1]
+        # add Ah and SOC values
+        is_net_charge = volts[0] < volts[-1]
         sign = +1 if is_net_charge else -1
 
-        if is_net_charge and data['Amps'].mean() <= 0.:
+        if is_net_charge and np.nanmean(amps) <= 0.:
             raise ValueError("Expected positive current for charge data.")
-        if not is_net_charge and data['Amps'].mean() >= 0.:
+        if not is_net_charge and np.nanmean(amps) >= 0.:
             raise ValueError("Expected negative current for discharge data.")
 
-        data['Ah'] = cumulative_trapezoid(
-            sign*data['Amps'], x=data['Seconds'] / 3600., initial=0.,
-        )
+        # trapezoidal capacity integral, as a prefix sum on the raw arrays
+        amps = sign*amps
+        hours = seconds / 3600.
+
+        Ah = np.empty_like(amps)
+        Ah[0] = 0.
+        np.cumsum(np.diff(hours)*(amps[1:] + amps[:-1]) / 2., out=Ah[1:])
 
         if is_net_charge:
-            data['SOC'] = data['Ah'] / data['Ah'].max()
+            SOC = Ah / Ah.max()
         else:
-            data['SOC'] = 1. - data['Ah'] / data['Ah'].max()
+            SOC = 1. - Ah / Ah.max()
+
+        # sort by SOC, keeping the first point at any repeated SOC
+        order = np.argsort(SOC, kind='stable')
 
-        # fit smoothing spline
-        _, mask = np.unique(data['SOC'], return_index=True)
+        Ah, SOC = Ah[order], SOC[order]
+        Volts = volts[order]
 
-        data = data.iloc[mask].reset_index(drop=True)
-        data = data.sort_values('SOC', ignore_index=True)
+        keep = np.empty(SOC.size, dtype=bool)
+        keep[0] = True
+        np.not_equal(SOC[1:], SOC[:-1], out=keep[1:])
 
-        Ah = data['Ah'].to_numpy()
-        SOC = data['SOC'].to_numpy()
-        Volts = data['Volts'].to_numpy()
+        Ah, SOC, Volts = Ah[keep], SOC[keep], Volts[keep]
 
-        # set spline and derivative
-        self._volts = make_splrep(SOC, Volts, s=s)
+        # set spline and derivative, as piecewise polynomials that evaluate
+        # without repeating the B-spline recursion on every call
+        self._volts = PPoly.from_spline(make_splrep(SOC, Volts, s=s))
         self._dvdq = self._volts.derivative()
 
         # add fit attributes
@@ -155,7 +164,7 @@ class DqdvSpline:
 
         volts_fit = self.volts_(self.SOC_)
         dvdq_fit = self.dvdq_(self.SOC_)
-        dqdv_fit = self.dqdv_(self.SOC_)
+        dqdv_fit = 1. / dvdq_fit
 
         mV_err = (volts_fit - volts_dat)*1e3
 
@@ -217,7 +226,7 @@ class DqdvSpline:
             Call 'fit' before evaluating.
 
         """
-        if not hasattr(self, '_volts'):
+        if self._volts is None:
             raise RuntimeError("Call 'fit' before evaluating.")
         return self._volts(soc)
 
@@ -242,7 +251,7 @@ class DqdvSpline:
             Call 'fit' before evaluating.
 
         """
-        if not hasattr(self, '_dvdq'):
+        if self._dvdq is None:
             raise RuntimeError("Call 'fit' before evaluating.")
         return self._dvdq(soc)
 
@@ -267,6 +276,6 @@ class DqdvSpline:
             Call 'fit' before evaluating.
 
         """
-        if not hasattr(self, '_dvdq'):
+        if self._dvdq is None:
             raise RuntimeError("Call 'fit' before evaluating.")
         return 1. / self._dvdq(soc)
@@ -72,23 +72,25 @@ def calc_lam_lli(fit_table: DqdvFitTable) -> pd.DataFrame:
     """
     from ampworks.dqdv._tables import DegModeTable
 
-    df = fit_table.df.copy()
+    # zero-copy views of the float columns where possible, never written below
+    df = fit_table.df
+    columns = ['Ah', 'xn0', 'xn0_std', 'xn1', 'xn1_std',
+               'xp0', 'xp0_std', 'xp1', 'xp1_std']
 
-    Ah = df.Ah.to_numpy()
+    values = [df[col].to_numpy(dtype=float, copy=False) for col in columns]
+    Ah, xn0, xn0_std, xn1, xn1_std, xp0, xp0_std, xp1, xp1_std = values
 
-    xn0, xn0_std = df.xn0.to_numpy(), df.xn0_std.to_numpy()
-    xn1, xn1_std = df.xn1.to_numpy(), df.xn1_std.to_numpy()
-    xp0, xp0_std = df.xp0.to_numpy(), df.xp0_std.to_numpy()
-    xp1, xp1_std = df.xp1.to_numpy(), df.xp1_std.to_numpy()
+    wn = xn1 - xn0  # stoichiometry windows
+    wp = xp1 - xp0
 
-    Qn = Ah / (xn1 - xn0)
-    Qp = Ah / (xp1 - xp0)
+    Qn = Ah / wn
+    Qp = Ah / wp
 
-    dQn = Ah / (xn1 - xn0)**2  # ignore lead -1 for xn1 b/c **2 below
-    Qn_std = np.sqrt((dQn*xn1_std)**2 + (dQn*xn0_std)**2)
+    dQn = Qn / wn  # ignore lead -1 for xn1 b/c squared below
+    Qn_std = np.hypot(dQn*xn1_std, dQn*xn0_std)
 
-    dQp = Ah / (xp1 - xp0)**2  # ignore lead -1 for xp1 b/c **2 below
-    Qp_std = np.sqrt((dQp*xp1_std)**2 + (dQp*xp0_std)**2)
+    dQp = Qp / wp  # ignore lead -1 for xp1 b/c squared below
+    Qp_std = np.hypot(dQp*xp1_std, dQp*xp0_std)
 
     LAMn = 1. - Qn / Qn[0]
     LAMp = 1. - Qp / Qp[0]
@@ -103,18 +105,18 @@ def calc_lam_lli(fit_table: DqdvFitTable) -> pd.DataFrame:
         ((Qn + xn0*dQn)*xn0_std)**2           # contribution from xn0
         + ((xn0*dQn)*xn1_std)**2                # contribution from xn1
         + ((-Qp + (1. - xp0)*dQp)*xp0_std)**2   # contribution from xp0
-        + (((1. - xp0)*dQp)*xn1_std)**2         # contribution from xp1
+        + (((1. - xp0)*dQp)*xp1_std)**2         # contribution from xp1
     )
 
     LLI_std = inv_std / inv[0]
 
-    aging = pd.DataFrame({
-        'Qn': Qn, 'Qn_std': Qn_std,
-        'Qp': Qp, 'Qp_std': Qp_std,
-        'LAMn': LAMn, 'LAMn_std': LAMn_std,
-        'LAMp': LAMp, 'LAMp_std': LAMp_std,
-        'LLI': LLI, 'LLI_std': LLI_std,
-    })
+    # one column-major block, pandas wraps it without consolidating columns
+    names = ['Qn', 'Qn_std', 'Qp', 'Qp_std', 'LAMn', 'LAMn_std',
+             'LAMp', 'LAMp_std', 'LLI', 'LLI_std']
+    values = np.vstack([Qn, Qn_std, Qp, Qp_std, LAMn, LAMn_std,
+                        LAMp, LAMp_std, LLI, LLI_std]).T
+
+    aging = pd.DataFrame(values, columns=names)
 
     return DegModeTable(aging)
 
@@ -169,10 +171,10 @@ def plot_lam_lli(deg_table: DegModeTable, fit_table: DqdvFitTable,
 
     # first row: Qn, Qp, Q
     if std:
-        Qn, Qn_std = df[['Qn', 'Qn_std']].T.to_numpy()
+        Qn, Qn_std = df['Qn'].to_numpy(), df['Qn_std'].to_numpy()
         axs[0, 0].fill_between(xplt, Qn - Qn_std, Qn + Qn_std, **shaded)
 
-        Qp, Qp_std = df[['Qp', 'Qp_std']].T.to_numpy()
+        Qp, Qp_std = df['Qp'].to_numpy(), df['Qp_std'].to_numpy()
         axs[0, 1].fill_between(xplt, Qp - Qp_std, Qp + Qp_std, **shaded)
 
     axs[0, 0].set_ylabel(r'$Q_{\rm NE}$ [Ah]')
@@ -181,13 +183,13 @@ def plot_lam_lli(deg_table: DegModeTable, fit_table: DqdvFitTable,
 
     # second row: LAMn, LAMp, LLI
     if std:
-        LAM, LAM_std = df[['LAMn', 'LAMn_std']].T.to_numpy()
+        LAM, LAM_std = df['LAMn'].to_numpy(), df['LAMn_std'].to_numpy()
         axs[1, 0].fill_between(xplt, LAM - LAM_std, LAM + LAM_std, **shaded)
 
-        LAM, LAM_std = df[['LAMp', 'LAMp_std']].T.to_numpy()
+        LAM, LAM_std = df['LAMp'].to_numpy(), df['LAMp_std'].to_numpy()
         axs[1, 1].fill_between(xplt, LAM - LAM_std, LAM + LAM_std, **shaded)
 
-        LLI, LLI_std = df[['LLI', 'LLI_std']].T.to_numpy()
+        LLI, LLI_std = df['LLI'].to_numpy(), df['LLI_std'].to_numpy()
         axs[1, 2].fill_between(xplt, LLI - LLI_std, LLI + LLI_std, **shaded)
 
     axs[1, 0].set_ylabel(r'LAM$_{\rm NE}$ [$-$]')
@@ -70,6 +70,28 @@ class DqdvFitTable(RichTable):
 
         super().__init__(df)
 
+    @property
+    def _df(self) -> pd.DataFrame:
+        """Stored DataFrame, after merging in any buffered rows."""
+        if '_frame' not in self.__dict__:  # not set yet, e.g., during copy
+            raise AttributeError('_df')
+
+        if self._rows:
+            new = pd.DataFrame(self._rows, columns=self._frame.columns)
+            if self._frame.empty:
+                self._frame = new
+            else:
+                self._frame = pd.concat([self._frame, new], ignore_index=True)
+
+            self._rows = []
+
+        return self._frame
+
+    @_df.setter
+    def _df(self, value: pd.DataFrame) -> None:
+        self._frame = value
+        self._rows = []
+
     def append(self, fit_result: DqdvFitResult, **extra_cols) -> None:
         """
         Append a new row to the table.
@@ -106,7 +128,7 @@ class DqdvFitTable(RichTable):
 
         # add in any extra columns
         for k in extra_cols.keys():
-            if k not in self.df.columns:
+            if k not in self._frame.columns:
                 raise ValueError(
                     f"Column '{k}' does not exist in 'DqdvFitResult'. Extra"
                     " columns must be defined during initialization."
@@ -114,8 +136,8 @@ class DqdvFitTable(RichTable):
 
             row[k] = extra_cols[k]
 
-        # append the new row
-        self.df.loc[len(self.df)] = row
+        # buffer the new row, rows are merged into 'df' when next accessed
+        self._rows.append(row)
 
 
 class DegModeTable(RichTable):
@@ -1,4 +1,5 @@
 import io
+import json
 import base64
 
 import dash
@@ -116,7 +117,7 @@ opt_data = {
     'xmax-bnd-pos': 0.1,
     'grid-Nx': 11,
     'max-iter': 1e5,
-    'xtol': 1e-8,
+    'ftol': 1e-8,
     'voltage': True,
     'dqdv': True,
     'dvdq': True,
@@ -156,8 +157,8 @@ optimize = html.Div([
         number_input('max-iter', 1e3, 1e6, 1, opt_data['max-iter']),
     ], style={'width': '90%', 'margin': '5px auto'}),
     dbc.Row([
-        dbc.Col(dbc.Label('x Tolerance')),
-        number_input('xtol', 1e-15, 1e-2, 'any', opt_data['xtol']),
+        dbc.Col(dbc.Label('f Tolerance')),
+        number_input('ftol', 1e-15, 1e-2, 'any', opt_data['ftol']),
     ], style={'width': '90%', 'margin': '5px auto'}),
 
     dbc.Label('Cost Terms', class_name='bold-label'),
@@ -429,10 +430,7 @@ def make_figure(params, flags, new_data=False):
     xn0, xn1, xp0, xp1 = params[:4]
 
     socp = (soc - xp0) / (xp1 - xp0)
-    ocv_p = fitter._ocv_p(soc)
-
     socn = (soc - xn0) / (xn1 - xn0)
-    ocv_n = fitter._ocv_n(soc)
 
     if new_data:
 
@@ -453,6 +451,10 @@ def make_figure(params, flags, new_data=False):
             autorangeoptions=dict(minallowed=ylims[0], maxallowed=ylims[1]),
         )
 
+        # electrode ocvs only depend on the data, sliders just shift them
+        figure.data[6].y = fitter._ocv_p(soc)
+        figure.data[7].y = fitter._ocv_n(soc)
+
     figure.data[3].y = volt_fit
     figure.data[4].y = dqdv_fit
     figure.data[5].y = dvdq_fit
@@ -462,10 +464,7 @@ def make_figure(params, flags, new_data=False):
     figure.layout.annotations[2].text = f"MAPE={dvdq_err:.2e}%"
 
     figure.data[6].x = socp
-    figure.data[6].y = ocv_p
-
     figure.data[7].x = socn
-    figure.data[7].y = ocv_n
 
     return figure
 
@@ -484,7 +483,7 @@ UPLOAD_IDS = ['neg', 'pos', 'cell']
 )
 def upload_data(contents_list, neg_s, pos_s, flags):
     trigger = dash.callback_context.triggered[0]['prop_id'].split('.')[0]
-    key = eval(trigger)['index']
+    key = json.loads(trigger)['index']
 
     contents = contents_list[UPLOAD_IDS.index(key)]
 
@@ -492,7 +491,8 @@ def upload_data(contents_list, neg_s, pos_s, flags):
         _, content_string = contents.split(',')
         decoded = base64.b64decode(content_string)
 
-        setattr(fitter, key, pd.read_csv(io.BytesIO(decoded)))
+        df = pd.read_csv(io.BytesIO(decoded), engine='pyarrow')
+        setattr(fitter, key, df)
         flags[key] = True
 
     params = np.array(neg_s + pos_s)
@@ -559,7 +559,7 @@ def update_on_button(_c, _m, neg_s, pos_s, opt_data, flags):
     trigger = dash.callback_context.triggered[0]['prop_id'].split('.')[0]
 
     options = {
-        'xtol': opt_data['xtol'],
+        'ftol': opt_data['ftol'],
         'maxiter': opt_data['max-iter'],
         'bounds': [
             opt_data['xmin-bnd-neg'],
@@ -0,0 +1,200 @@
+import pytest
+import numpy as np
+import pandas as pd
+import ampworks as amp
+
+
+def neg_ocv(x):
+    return 0.1 + 0.9*np.exp(-8.*x) + 0.05*(1. - x)
+
+
+def pos_ocv(x):
+    return 3.6 + 0.6*x + 0.1*np.tanh(6.*(x - 0.5))
+
+
+@pytest.fixture(scope='module')
+def fitter():
+    soc = np.linspace(0., 1., 301)
+
+    neg = pd.DataFrame({'soc': soc, 'voltage': neg_ocv(soc)})
+    pos = pd.DataFrame({'soc': soc, 'voltage': pos_ocv(soc)})
+
+    xn0, xn1, xp0, xp1 = 0.05, 0.85, 0.1, 0.9
+    volts = pos_ocv(xp0 + (xp1 - xp0)*soc) - neg_ocv(xn0 + (xn1 - xn0)*soc)
+
+    cell = pd.DataFrame({'soc': soc, 'voltage': volts})
+
+    return amp.dqdv.DqdvFitter(neg, pos, cell)
+
+
+def test_grid_search_matches_err_func(fitter):
+
+    Nx = 6
+    result = fitter.grid_search(Nx)
+
+    span = np.linspace(0., 1., Nx)
+    best, nfev = np.inf, 0
+    for p in amp.mathutils.combinations([span]*4):
+        if p[0] < p[1] and p[2] < p[3]:
+            best = min(best, fitter._err_func(np.array(list(p.values()))))
+            nfev += 1
+
+    assert result.nfev == nfev
+    assert result.x.size == 5 and result.x[-1] == 0.
+    np.testing.assert_allclose(result.fun, best)
+    np.testing.assert_allclose(fitter._err_func(result.x[:4]), best)
+
+
+def test_hessian_central_differences():
+    from ampworks.dqdv._dqdv_fitter import _hessian
+
+    A = np.array([[2., 1., 0.], [1., 3., -1.], [0., -1., 4.]])
+
+    def func(x):
+        return 0.5*x @ A @ x + np.sin(x[0])
+
+    x = np.array([0.3, 0.7, -0.2])
+
+    expected = A.copy()
+    expected[0, 0] -= np.sin(x[0])
+
+    hess = _hessian(func, x)
+
+    np.testing.assert_allclose(hess, hess.T)
+    np.testing.assert_allclose(hess, expected, rtol=1e-6, atol=1e-6)
+
+
+def test_fit_table_append():
+
+    def fit_result(i):
+        result = amp.dqdv.DqdvFitResult(
+            success=True, message='done', nfev=1, niter=1, fun=0.1*i,
+            x=np.arange(5.) + i, x_std=np.ones(5),
+            x_map=['xn0', 'xn1', 'xp0', 'xp1', 'iR'],
+        )
+        result.Ah = 1. + i
+        return result
+
+    table = amp.dqdv.DqdvFitTable(extra_cols=['efc'])
+    for i in range(3):
+        table.append(fit_result(i), efc=10*i)
+
+    copied = table.copy()
+    copied.append(fit_result(3))
+
+    assert len(table.df) == 3 and len(copied.df) == 4
+    assert table.df['efc'].tolist() == [0, 10, 20]
+    np.testing.assert_allclose(table['xn0'], [0., 1., 2.])
+    np.testing.assert_allclose(copied.fun, [0., 0.1, 0.2, 0.3])
+
+    with pytest.raises(ValueError):
+        table.append(fit_result(4), cycles=100)
+
+
+def test_n_soc(fitter):
+
+    params = np.array([0.05, 0.85, 0.1, 0.9])
+
+    fitter.n_soc = 51
+    errs = fitter.err_terms(params)
+    assert errs['soc'].size == errs['volt_fit'].size == 51
+
+    fitter.n_soc = 201
+    errs = fitter.err_terms(params)
+    assert errs['soc'].size == errs['volt_data'].size == 201
+
+    with pytest.raises(TypeError):
+        fitter.n_soc = 51.
+
+    with pytest.raises(ValueError):
+        fitter.n_soc = 1
+
+
+def test_constrained_fit_recovers_stoichiometry(fitter):
+
+    x0 = np.array([0.1, 0.8, 0.15, 0.85])
+    result = fitter.constrained_fit(x0)
+
+    assert result.success
+    assert result.x_map == ['xn0', 'xn1', 'xp0', 'xp1', 'iR']
+    np.testing.assert_allclose(result.x[:4], [0.05, 0.85, 0.1, 0.9], atol=1e-3)
+    np.testing.assert_allclose(result.x[4], 0., atol=1e-3)
+
+
+def test_constrained_fit_xtol_deprecated(fitter):
+
+    x0 = np.array([0.1, 0.8, 0.15, 0.85])
+    with pytest.warns(DeprecationWarning, match='xtol'):
+        result = fitter.constrained_fit(x0, xtol=1e-8)
+
+    expected = fitter.constrained_fit(x0, ftol=1e-8)
+    np.testing.assert_allclose(result.x, expected.x)
+
+
+def test_dqdv_spline_fit():
+
+    seconds = np.linspace(0., 3600., 181)
+    volts = 3.4 + 0.7*(seconds / 3600.)
+
+    charge = amp.Dataset({'Seconds': seconds, 'Amps': 2., 'Volts': volts})
+    spline = amp.dqdv.DqdvSpline().fit(charge)
+
+    np.testing.assert_allclose(spline.Ah_[-1], 2.)
+    np.testing.assert_allclose(spline.SOC_, seconds / 3600.)
+    np.testing.assert_allclose(spline.dvdq_([0.25, 0.75]), 0.7)
+    np.testing.assert_allclose(spline.dqdv_([0.25, 0.75]), 1. / 0.7)
+    assert isinstance(spline.dqdv_(0.5), np.float64)
+    assert spline.score_ < 1e-12
+
+    discharge = charge.assign(Amps=-2., Volts=volts[::-1])
+    spline = amp.dqdv.DqdvSpline().fit(discharge)
+
+    np.testing.assert_allclose(spline.SOC_, seconds / 3600.)
+    np.testing.assert_allclose(spline.volts_(spline.SOC_), volts)
+
+    with pytest.raises(ValueError):
+        _ = amp.dqdv.DqdvSpline().fit(charge.assign(Amps=-2.))
+
+    with pytest.raises(RuntimeError):
+        _ = amp.dqdv.DqdvSpline().volts_(0.5)
+
+
+def test_calc_lam_lli_uncertainty():
+
+    x = np.array([[0.02, 0.85, 0.10, 0.90],
+                  [0.03, 0.82, 0.12, 0.88]])
+    x_std = np.array([[1e-3, 2e-3, 3e-3, 4e-3],
+                      [2e-3, 1e-3, 4e-3, 5e-3]])
+    Ah = np.array([3.0, 2.8])
+
+    table = amp.dqdv.DqdvFitTable()
+    for i in range(2):
+        result = amp.dqdv.DqdvFitResult(
+            success=True, message='done', nfev=1, niter=1, fun=0.,
+            x=np.append(x[i], 0.), x_std=np.append(x_std[i], 0.),
+            x_map=['xn0', 'xn1', 'xp0', 'xp1', 'iR'],
+        )
+        result.Ah = Ah[i]
+        table.append(result)
+
+    deg_modes = amp.dqdv.calc_lam_lli(table)
+
+    def inventory(x, Ah):
+        xn0, xn1, xp0, xp1 = x
+        return xn0*Ah / (xn1 - xn0) + (1. - xp0)*Ah / (xp1 - xp0)
+
+    # first-order propagation with finite difference sensitivities
+    inv, inv_std = np.zeros(2), np.zeros(2)
+    for i in range(2):
+        inv[i] = inventory(x[i], Ah[i])
+        for j in range(4):
+            dx = np.zeros(4)
+            dx[j] = 1e-6
+            grad = (inventory(x[i] + dx, Ah[i])
+                    - inventory(x[i] - dx, Ah[i])) / 2e-6
+            inv_std[i] += (grad*x_std[i, j])**2
+
+    inv_std = np.sqrt(inv_std)
+
+    np.testing.assert_allclose(deg_modes['LLI'], 1. - inv / inv[0])
+    np.testing.assert_allclose(deg_modes['LLI_std'], inv_std / inv[0])
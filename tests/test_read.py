@@ -0,0 +1,203 @@
+import pytest
+import numpy as np
+import pandas as pd
+import ampworks as amp
+
+
+@pytest.fixture
+def raw_frame():
+    return pd.DataFrame({
+        'Test_Time(s)': [0., 1., 2., 3.],
+        'Current(mA)': [0., 1000., -500., 0.],
+        'Voltage(V)': [3.5, 3.6, 3.4, 3.5],
+        'Cycle_Index': [1, 1, 2, 2],
+        'Charge_Capacity(Ah)': [0., 0.1, 0.1, 0.1],
+        'Discharge_Capacity(Ah)': [0., 0., 0.2, 0.2],
+    })
+
+
+def test_header_matches():
+    from ampworks._core._read import header_matches, REQUIRED_HEADERS
+
+    assert header_matches(['Time (s)', 'Current(A)', 'Volts'], REQUIRED_HEADERS)
+    assert not header_matches(['Time (s)', 'Volts'], REQUIRED_HEADERS)
+    assert not header_matches(['Device', 'XYZ'], REQUIRED_HEADERS)
+
+
+def test_read_csv_with_preamble(tmp_path, raw_frame):
+
+    filepath = tmp_path.joinpath('data.csv')
+    with open(filepath, 'w') as f:
+        f.write("Some preamble\nDevice,XYZ\n\n")
+        raw_frame.to_csv(f, index=False)
+
+    with pytest.warns(UserWarning, match='No valid headers'):
+        data = amp.read_csv(filepath)
+
+    assert isinstance(data, amp.Dataset)
+    assert len(data) == 4
+
+    np.testing.assert_allclose(data['Amps'], [0., 1., -0.5, 0.])
+    np.testing.assert_allclose(data['Ah'], [0., 0.1, 0.2, 0.1])
+
+    assert data['State'].tolist() == ['R', 'C', 'D', 'R']
+    assert data['Cycle'].dtype == np.int64
+
+
+def test_read_csv_long_preamble(tmp_path, raw_frame):
+
+    filepath = tmp_path.joinpath('data.csv')
+    with open(filepath, 'w') as f:
+        f.writelines(f"Meta {i},value {i}\n" for i in range(50))
+        raw_frame.to_csv(f, index=False)
+
+    with pytest.warns(UserWarning, match='No valid headers'):
+        data = amp.read_csv(filepath)
+
+    assert len(data) == 4
+    np.testing.assert_allclose(data['Volts'], [3.5, 3.6, 3.4, 3.5])
+
+
+def test_read_csv_ragged_rows(tmp_path):
+
+    filepath = tmp_path.joinpath('data.csv')
+    filepath.write_text(
+        "Time(s),Current(A),Voltage(V),Capacity(Ah)\n"
+        "0,1,3.5,0\n"
+        "1,1,3.6\n"
+        "2,1,3.7,0.1\n"
+    )
+
+    with pytest.warns(UserWarning, match='No valid headers'):
+        data = amp.read_csv(filepath)
+
+    assert len(data) == 3
+    np.testing.assert_allclose(data['Volts'], [3.5, 3.6, 3.7])
+    np.testing.assert_allclose(data['Ah'], [0., np.nan, 0.1])
+
+
+def test_read_csv_thousands_separator(tmp_path):
+
+    filepath = tmp_path.joinpath('data.csv')
+    filepath.write_text(
+        'Time(s),Current(A),Voltage(V)\n'
+        '"1,000",1,3.5\n'
+        '"2,000",1,3.6\n'
+    )
+
+    with pytest.warns(UserWarning, match='No valid headers'):
+        data = amp.read_csv(filepath)
+
+    assert data['Seconds'].dtype == np.float64
+    np.testing.assert_allclose(data['Seconds'], [1000., 2000.])
+
+
+def test_read_csv_duplicate_headers(tmp_path):
+
+    filepath = tmp_path.joinpath('data.csv')
+    filepath.write_text(
+        "Time(s),Current(A),Voltage(V),Step,Step,Voltage(V)\n"
+        "0,1,3.5,1,7,9.9\n"
+        "1,1,3.6,2,8,9.9\n"
+    )
+
+    with pytest.warns(UserWarning, match='No valid headers'):
+        data = amp.read_csv(filepath)
+
+    assert data['Step'].tolist() == [1, 2]
+    np.testing.assert_allclose(data['Volts'], [3.5, 3.6])
+
+
+def test_read_table(tmp_path, raw_frame):
+
+    filepath = tmp_path.joinpath('data.txt')
+    raw_frame.to_csv(filepath, sep='\t', index=False)
+
+    with pytest.warns(UserWarning, match='No valid headers'):
+        data = amp.read_table(filepath)
+
+    assert len(data) == 4
+    assert {'Seconds', 'Amps', 'Volts', 'State', 'Ah'}.issubset(data.columns)
+
+
+def test_read_csv_no_headers(tmp_path):
+
+    filepath = tmp_path.joinpath('data.csv')
+    filepath.write_text("a,b,c\n1,2,3\n")
+
+    with pytest.warns(UserWarning, match='No valid headers found in'):
+        data = amp.read_csv(filepath)
+
+    assert isinstance(data, amp.Dataset)
+    assert data.empty
+
+
+def test_read_excel(tmp_path, raw_frame):
+
+    filepath = tmp_path.joinpath('data.xlsx')
+    with pd.ExcelWriter(filepath) as writer:
+        pd.DataFrame({'a': [1, 2]}).to_excel(writer, sheet_name='info')
+        raw_frame.to_excel(writer, sheet_name='data', index=False, startrow=2)
+
+    with pytest.warns(UserWarning, match='No valid headers'):
+        data = amp.read_excel(filepath)
+
+    assert len(data) == 4
+    np.testing.assert_allclose(data['Seconds'], [0., 1., 2., 3.])
+
+    with pytest.raises(ValueError):
+        _ = amp.read_excel(filepath, sheet_name='missing')
+
+
+def test_read_many(tmp_path, raw_frame):
+
+    filepaths = []
+    for i in range(3):
+        filepath = tmp_path.joinpath(f"data{i}.csv")
+        raw_frame.iloc[:i + 2].to_csv(filepath, index=False)
+        filepaths.append(filepath)
+
+    datasets = amp.read_many(filepaths, max_workers=2)
+
+    assert len(datasets) == 3
+    assert all(isinstance(data, amp.Dataset) for data in datasets)
+    assert [len(data) for data in datasets] == [2, 3, 4]
+
+
+def test_standardize_headers_no_matches():
+    from ampworks._core._read import standardize_headers
+
+    with pytest.warns(UserWarning, match='No valid headers'):
+        data = standardize_headers(pd.DataFrame({'x': [1., 2.]}))
+
+    assert isinstance(data, amp.Dataset)
+    assert data.empty
+
+
+def test_read_csv_state_sign_convention(tmp_path):
+
+    filepath = tmp_path.joinpath('data.csv')
+    filepath.write_text(
+        "Seconds,Amps,Volts,MD,Charge_Capacity(Ah),Discharge_Capacity(Ah)\n"
+        "0,2,3.5,C,1,5\n"
+        "1,2,3.5,,1,5\n"
+        "2,2,3.5,D,1,5\n"
+        "3,2,3.5,R,1,5\n"
+    )
+
+    with pytest.warns(UserWarning, match='No valid headers'):
+        data = amp.read_csv(filepath)
+
+    np.testing.assert_allclose(data['Amps'], [2., 2., -2., 0.])
+    np.testing.assert_allclose(data['Ah'], [1., 1., 5., 1.])
+
+
+def test_excel_engine_old_pandas(monkeypatch):
+    from ampworks._core._read import _excel_engine
+
+    monkeypatch.setattr(pd, '__version__', '2.1.4')
+    _excel_engine.cache_clear()
+
+    assert _excel_engine() is None
+
+    _excel_engine.cache_clear()